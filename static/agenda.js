@@ -1,19 +1,25 @@
 document.addEventListener('DOMContentLoaded', function() {
     const calendarEl = document.getElementById('calendar');
     const eventsData = document.getElementById('events-data');
+    // Flux JSON interrogé par FullCalendar avec ?start=&end= de la plage affichée
+    const eventsUrl = calendarEl.dataset.eventsUrl;
 
-    // Vérifie que eventsData existe et contient des données
-    if (!eventsData) {
+    // Vérifie qu'une source d'événements est disponible
+    if (!eventsUrl && !eventsData) {
         console.error("Éléments events-data introuvable !");
         return;
     }
 
     let events = [];
-    try {
-        events = JSON.parse(eventsData.textContent);
-        console.log("Événements chargés :", events); // Affiche les événements dans la console
-    } catch (e) {
-        console.error("Erreur lors de l'analyse des événements :", e);
+    if (eventsUrl) {
+        events = eventsUrl;
+    } else {
+        try {
+            events = JSON.parse(eventsData.textContent);
+            console.log("Événements chargés :", events); // Affiche les événements dans la console
+        } catch (e) {
+            console.error("Erreur lors de l'analyse des événements :", e);
+        }
     }
 
     const calendar = new FullCalendar.Calendar(calendarEl, {